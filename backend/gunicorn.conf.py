@@ -0,0 +1,23 @@
+"""
+Gunicorn configuration for the yfinance backend
+Runs several uvicorn workers so CPU-bound pandas work can use more than one core
+"""
+
+import os
+
+# Total concurrent Yahoo calls across all workers (each worker gets a share)
+UPSTREAM_TOTAL_CONCURRENCY = int(os.getenv("UPSTREAM_TOTAL_CONCURRENCY", "8"))
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+# Each worker has its own upstream semaphore and in-process cache, so keep the
+# default small; more workers mostly mean more parallel calls to Yahoo.
+# Capped at the budget so every worker gets at least one slot without exceeding it.
+workers = min(int(os.getenv("WEB_CONCURRENCY", "2")), max(1, UPSTREAM_TOTAL_CONCURRENCY))
+worker_class = "uvicorn_worker.UvicornWorker"
+timeout = 60
+
+# Split the budget across workers (read by main.py)
+os.environ.setdefault(
+    "UPSTREAM_CONCURRENCY",
+    str(max(1, UPSTREAM_TOTAL_CONCURRENCY // workers)),
+)
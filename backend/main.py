@@ -3,11 +3,30 @@ yfinance Backend Server
 Provides stock quote data using the yfinance Python library
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
+from cachetools import TTLCache
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from curl_cffi import requests as curl_requests
+import asyncio
+import functools
+import json
+import numpy as np
+import pandas as pd
+import operator
+import os
+import random
+import redis.asyncio as redis
 import yfinance as yf
+from yfinance.exceptions import YFRateLimitError
 
 app = FastAPI(
     title="yfinance Stock Quote API",
@@ -24,6 +43,200 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (history and options chains are highly repetitive JSON)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Shared HTTP session so connections to Yahoo are reused across requests.
+# curl_cffi keeps a curl handle per thread, so each threadpool worker holds
+# its own keep-alive connection.
+YF_SESSION = curl_requests.Session(impersonate="chrome")
+
+# Bound concurrent upstream calls so bursts queue here rather than at Yahoo,
+# which starts rate limiting (and yfinance slows down) under heavy concurrency.
+# The limit is per process; gunicorn.conf.py splits a total budget across workers.
+UPSTREAM_CONCURRENCY = int(os.getenv("UPSTREAM_CONCURRENCY", "8"))
+UPSTREAM_RETRIES = 3
+UPSTREAM_SEM = asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+
+
+async def run_upstream(fn, *args, **kwargs):
+    """
+    Run a blocking yfinance call on the threadpool while holding an upstream slot.
+    Rate-limited calls are retried with exponential backoff.
+    """
+    for attempt in range(UPSTREAM_RETRIES + 1):
+        try:
+            async with UPSTREAM_SEM:
+                return await run_in_threadpool(fn, *args, **kwargs)
+        except YFRateLimitError:
+            if attempt == UPSTREAM_RETRIES:
+                raise
+        # Back off outside the semaphore so other requests can proceed
+        await asyncio.sleep(0.5 * 2 ** attempt + random.random() * 0.1)
+
+
+# Optional Redis cache shared across workers (disabled when REDIS_URL is unset)
+REDIS_URL = os.getenv("REDIS_URL")
+# Short socket timeouts so an unreachable Redis fails over to a live fetch
+# instead of stalling requests
+redis_client = redis.Redis.from_url(
+    REDIS_URL,
+    socket_connect_timeout=0.25,
+    socket_timeout=0.25,
+) if REDIS_URL else None
+
+# Cache TTLs in seconds, tiered by how quickly each kind of data goes stale
+CACHE_TTL = {
+    "quote": 10,
+    "quotes": 10,
+    "iv": 60,
+    "options": 60,
+    "expirations": 900,
+    "history": 300,
+    "fundamentals": 3600,
+    "earnings": 3600,
+    "search": 3600,
+}
+
+_cache_locks: dict = {}
+
+
+@asynccontextmanager
+async def key_lock(locks: dict, key):
+    """
+    Hold a per-key asyncio lock. The lock is refcounted and only dropped once
+    no task holds or waits on it, so queued waiters still share one fetch.
+    """
+    entry = locks.setdefault(key, [asyncio.Lock(), 0])
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0:
+            del locks[key]
+
+
+def cached(prefix: str, cacheable=None, key_params=None):
+    """
+    Cache a route's response in Redis, keyed by prefix and request params.
+    Hits are served as the stored JSON bytes without re-parsing, and
+    concurrent misses on the same key wait on a single upstream fetch.
+    cacheable, if given, decides whether a computed result may be stored;
+    key_params, if given, maps the request params to normalized key parts.
+    """
+    ttl = CACHE_TTL[prefix]
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(**kwargs):
+            if redis_client is None:
+                return await func(**kwargs)
+
+            params = key_params(**kwargs) if key_params else kwargs.values()
+            key = ":".join([prefix] + [str(v).upper() for v in params])
+
+            async def lookup():
+                try:
+                    hit = await redis_client.get(key)
+                except Exception:
+                    return None
+                if hit is None:
+                    return None
+                return Response(content=hit, media_type="application/json")
+
+            hit = await lookup()
+            if hit is not None:
+                return hit
+
+            async with key_lock(_cache_locks, key):
+                # Another request may have filled the cache while we waited
+                hit = await lookup()
+                if hit is not None:
+                    return hit
+
+                result = await func(**kwargs)
+                if isinstance(result, Response):
+                    # Streamed responses are too large to cache
+                    return result
+                if cacheable is not None and not cacheable(result):
+                    return result
+
+                if isinstance(result, BaseModel):
+                    payload = result.model_dump_json()
+                else:
+                    payload = json.dumps(jsonable_encoder(result), separators=(",", ":"))
+                # Jitter the TTL so hot keys don't all expire at once
+                try:
+                    await redis_client.set(key, payload, ex=ttl + random.randint(0, ttl // 10))
+                except Exception:
+                    pass
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+# In-process cache for the yfinance lookups shared by several endpoints
+# (e.g. /iv and /options both need the price, expirations and chain)
+_yf_cache = TTLCache(maxsize=1024, ttl=30)
+_yf_locks: dict = {}
+_MISSING = object()
+
+
+async def yf_cached(key: tuple, fn):
+    """
+    Run a blocking yfinance lookup on the threadpool, memoized for a short TTL.
+    Concurrent calls for the same key share a single upstream fetch.
+    """
+    value = _yf_cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+
+    async with key_lock(_yf_locks, key):
+        value = _yf_cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = await run_upstream(fn)
+            # Don't pin empty results (no price, no expirations) for the whole TTL
+            if value:
+                _yf_cache[key] = value
+        return value
+
+
+def fetch_last_price(ticker) -> Optional[float]:
+    """
+    Get the latest price from fast_info when no other info fields are needed
+    """
+    fi = ticker.fast_info
+    return fi.last_price or fi.previous_close
+
+
+def make_ticker(symbol: str):
+    """Create a ticker bound to the shared session"""
+    return yf.Ticker(symbol, session=YF_SESSION)
+
+
+async def get_info(symbol: str) -> dict:
+    """Full ticker.info for a symbol"""
+    return await yf_cached(("info", symbol), lambda: make_ticker(symbol).info)
+
+
+async def get_last_price(symbol: str) -> Optional[float]:
+    """Latest price for a symbol via fast_info"""
+    return await yf_cached(("price", symbol), lambda: fetch_last_price(make_ticker(symbol)))
+
+
+async def get_expirations(symbol: str) -> tuple:
+    """Available options expiration dates for a symbol"""
+    return await yf_cached(("options", symbol), lambda: make_ticker(symbol).options)
+
+
+async def get_option_chain(symbol: str, expiry: str):
+    """Options chain for a symbol and expiration"""
+    return await yf_cached(("chain", symbol, expiry), lambda: make_ticker(symbol).option_chain(expiry))
+
 
 class QuoteResponse(BaseModel):
     symbol: str
@@ -44,6 +257,11 @@ class QuoteResponse(BaseModel):
     beta: Optional[float] = None
 
 
+class QuotesResponse(BaseModel):
+    quotes: list[QuoteResponse]
+    failed: list[str] = []  # Symbols whose upstream fetch errored (e.g. rate limited)
+
+
 class SearchResult(BaseModel):
     symbol: str
     shortname: Optional[str] = None
@@ -91,13 +309,13 @@ async def health_check():
 
 
 @app.get("/quote/{symbol}", response_model=QuoteResponse)
+@cached("quote")
 async def get_quote(symbol: str):
     """
     Get stock quote for a given symbol
     """
     try:
-        ticker = yf.Ticker(symbol.upper())
-        info = ticker.info
+        info = await get_info(symbol.upper())
 
         # Check if we got valid data
         price = info.get("currentPrice") or info.get("regularMarketPrice")
@@ -128,27 +346,91 @@ async def get_quote(symbol: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+MAX_BATCH_SYMBOLS = 50
+
+
+def fetch_fast_quote(ticker) -> Optional[QuoteResponse]:
+    """
+    Build a quote from fast_info, which skips Yahoo's heavyweight quoteSummary call.
+    Returns None if the symbol has no price data; upstream errors propagate.
+    """
+    fi = ticker.fast_info
+    price = fi.last_price
+    if not price:
+        return None
+
+    return QuoteResponse(
+        symbol=ticker.ticker,
+        price=price,
+        previousClose=fi.previous_close or price,
+        open=fi.open,
+        dayHigh=fi.day_high,
+        dayLow=fi.day_low,
+        volume=int(fi.last_volume) if fi.last_volume else None,
+        marketCap=int(fi.market_cap) if fi.market_cap else None,
+        currency=fi.currency or "USD",
+        exchange=fi.exchange,
+        fiftyTwoWeekHigh=fi.year_high,
+        fiftyTwoWeekLow=fi.year_low,
+        averageVolume=int(fi.three_month_average_volume) if fi.three_month_average_volume else None,
+    )
+
+
+def parse_symbols(symbols: str) -> list:
+    """Normalize a comma-separated symbol list (uppercased, deduplicated, sorted)"""
+    return sorted({s.strip().upper() for s in symbols.split(",") if s.strip()})
+
+
+@app.get("/quotes", response_model=QuotesResponse)
+@cached(
+    "quotes",
+    cacheable=lambda r: not r.failed,
+    key_params=lambda symbols: [",".join(parse_symbols(symbols))],
+)
+async def get_quotes(symbols: str):
+    """
+    Get quotes for several comma-separated symbols in one request.
+    Quotes are sorted by symbol.
+    """
+    syms = parse_symbols(symbols)
+    if not syms:
+        raise HTTPException(status_code=400, detail="No symbols provided")
+    if len(syms) > MAX_BATCH_SYMBOLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many symbols (max {MAX_BATCH_SYMBOLS})"
+        )
+
+    try:
+        tickers = yf.Tickers(" ".join(syms), session=YF_SESSION)
+        results = await asyncio.gather(*(
+            run_upstream(fetch_fast_quote, tickers.tickers[s]) for s in syms
+        ), return_exceptions=True)
+        return QuotesResponse(
+            quotes=[q for q in results if isinstance(q, QuoteResponse)],
+            failed=[s for s, q in zip(syms, results) if isinstance(q, BaseException)],
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/iv/{symbol}", response_model=IVResponse)
+@cached("iv", cacheable=lambda r: r.source != "fallback")
 async def get_implied_volatility(symbol: str):
     """
     Get implied volatility for a stock from its options chain.
     Returns the IV of the ATM (at-the-money) option for the nearest expiration.
     """
-    from datetime import datetime
-
     try:
-        ticker = yf.Ticker(symbol.upper())
-
-        # Get current price for ATM calculation
-        info = ticker.info
-        current_price = info.get("currentPrice") or info.get("regularMarketPrice")
-        if not current_price:
-            raise HTTPException(status_code=404, detail=f"No price data for symbol: {symbol}")
-
-        # Get available expiration dates
-        expirations = ticker.options
+        # Get available expiration dates first; the full info is only
+        # needed when there are no options to read IV from
+        expirations = await get_expirations(symbol.upper())
         if not expirations:
             # No options available - return estimated IV based on beta
+            info = await get_info(symbol.upper())
+            if not (info.get("currentPrice") or info.get("regularMarketPrice")):
+                raise HTTPException(status_code=404, detail=f"No price data for symbol: {symbol}")
+
             beta = info.get("beta", 1.0) or 1.0
             estimated_iv = 20 + (beta - 1) * 15  # Higher beta = higher IV
             return IVResponse(
@@ -161,16 +443,22 @@ async def get_implied_volatility(symbol: str):
         # Get the nearest expiration (first one)
         nearest_exp = expirations[0]
 
-        # Get options chain for nearest expiration
-        chain = ticker.option_chain(nearest_exp)
+        # Get current price for ATM calculation alongside the nearest chain
+        current_price, chain = await asyncio.gather(
+            get_last_price(symbol.upper()),
+            get_option_chain(symbol.upper(), nearest_exp),
+        )
+        if not current_price:
+            raise HTTPException(status_code=404, detail=f"No price data for symbol: {symbol}")
+
         calls = chain.calls
 
         if calls.empty:
             raise HTTPException(status_code=404, detail=f"No options data for symbol: {symbol}")
 
         # Find ATM strike (closest to current price)
-        calls['distance'] = abs(calls['strike'] - current_price)
-        atm_row = calls.loc[calls['distance'].idxmin()]
+        strikes = calls['strike'].to_numpy()
+        atm_row = calls.iloc[np.abs(strikes - current_price).argmin()]
 
         # Get implied volatility (yfinance returns it as decimal, e.g., 0.25 for 25%)
         iv = atm_row.get('impliedVolatility', 0.30)
@@ -192,7 +480,6 @@ async def get_implied_volatility(symbol: str):
         raise
     except Exception as e:
         # Fallback to estimated IV
-        from datetime import datetime
         return IVResponse(
             symbol=symbol.upper(),
             iv=30.0,  # Default fallback
@@ -202,6 +489,7 @@ async def get_implied_volatility(symbol: str):
 
 
 @app.get("/search")
+@cached("search", cacheable=lambda r: bool(r["results"]))
 async def search_symbols(q: str):
     """
     Search for stock symbols
@@ -210,8 +498,7 @@ async def search_symbols(q: str):
     try:
         # yfinance doesn't have a search endpoint, so we try to get info
         # for the query as a symbol and return it if found
-        ticker = yf.Ticker(q.upper())
-        info = ticker.info
+        info = await get_info(q.upper())
 
         if info.get("symbol"):
             return {
@@ -229,7 +516,50 @@ async def search_symbols(q: str):
         return {"results": []}
 
 
+def to_records(df) -> list:
+    """
+    Convert a dataframe to a list of row dicts, with NaN/NA replaced by None
+    column-wise instead of checking each cell
+    """
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
+def format_timestamps(index) -> np.ndarray:
+    """
+    Format a DatetimeIndex like Timestamp.isoformat() in one vectorized pass.
+    (DatetimeIndex.strftime falls back to a per-row Python loop for tz-aware data.)
+    """
+    if index.tz is None:
+        return np.datetime_as_string(index.values, unit="s")
+
+    local = index.tz_localize(None)
+    dates = np.datetime_as_string(local.values, unit="s")
+
+    # Only a handful of distinct UTC offsets (e.g. DST switches), so format those once
+    offsets = (local - index.tz_convert("UTC").tz_localize(None)).total_seconds() // 60
+    unique, inverse = np.unique(offsets.astype(int), return_inverse=True)
+    suffixes = np.array([
+        f"{'+' if m >= 0 else '-'}{abs(m) // 60:02d}:{abs(m) % 60:02d}" for m in unique
+    ])
+    return np.char.add(dates, suffixes[inverse])
+
+
+HISTORY_STREAM_ROWS = 5000
+HISTORY_CHUNK_ROWS = 1000
+
+
+def stream_history(symbol: str, hist):
+    """Yield a history response as JSON, serializing a chunk of rows at a time"""
+    yield f'{{"symbol":{json.dumps(symbol)},"data":['.encode()
+    for start in range(0, len(hist), HISTORY_CHUNK_ROWS):
+        chunk = hist.iloc[start:start + HISTORY_CHUNK_ROWS]
+        rows = json.dumps(to_records(chunk), separators=(",", ":"))[1:-1]
+        yield (("," if start else "") + rows).encode()
+    yield b"]}"
+
+
 @app.get("/history/{symbol}")
+@cached("history")
 async def get_history(symbol: str, period: str = "1mo", interval: str = "1d"):
     """
     Get historical price data for a symbol
@@ -238,23 +568,31 @@ async def get_history(symbol: str, period: str = "1mo", interval: str = "1d"):
     interval: 1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo
     """
     try:
-        ticker = yf.Ticker(symbol.upper())
-        hist = ticker.history(period=period, interval=interval)
+        ticker = make_ticker(symbol.upper())
+        hist = await run_upstream(ticker.history, period=period, interval=interval)
 
         if hist.empty:
             raise HTTPException(status_code=404, detail=f"No history for symbol: {symbol}")
 
-        # Convert to list of dicts
-        data = []
-        for index, row in hist.iterrows():
-            data.append({
-                "date": index.isoformat(),
-                "open": row.get("Open"),
-                "high": row.get("High"),
-                "low": row.get("Low"),
-                "close": row.get("Close"),
-                "volume": row.get("Volume"),
-            })
+        # Convert to list of dicts column-wise instead of iterating rows
+        hist = hist.rename(columns={
+            "Open": "open",
+            "High": "high",
+            "Low": "low",
+            "Close": "close",
+            "Volume": "volume",
+        })
+        hist["date"] = format_timestamps(hist.index)
+        hist = hist[["date", "open", "high", "low", "close", "volume"]]
+
+        # Stream large (e.g. intraday) histories rather than building the full payload
+        if len(hist) > HISTORY_STREAM_ROWS:
+            return StreamingResponse(
+                stream_history(symbol.upper(), hist),
+                media_type="application/json"
+            )
+
+        data = to_records(hist)
 
         return {"symbol": symbol.upper(), "data": data}
     except HTTPException:
@@ -264,13 +602,13 @@ async def get_history(symbol: str, period: str = "1mo", interval: str = "1d"):
 
 
 @app.get("/options/{symbol}/expirations")
+@cached("expirations")
 async def get_options_expirations(symbol: str):
     """
     Get available options expiration dates for a symbol
     """
     try:
-        ticker = yf.Ticker(symbol.upper())
-        expirations = ticker.options
+        expirations = await get_expirations(symbol.upper())
 
         if not expirations:
             raise HTTPException(
@@ -288,25 +626,28 @@ async def get_options_expirations(symbol: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+OPTION_COLUMNS = [
+    'contractSymbol', 'strike', 'lastPrice', 'bid', 'ask', 'change',
+    'percentChange', 'volume', 'openInterest', 'impliedVolatility', 'inTheMoney',
+]
+
+
 @app.get("/options/{symbol}", response_model=OptionsChainResponse)
+@cached("options")
 async def get_options_chain(symbol: str, expiry: str = None):
     """
     Get full options chain for a symbol.
     If expiry is not provided, returns the nearest expiration.
     """
-    import math
-
     try:
-        ticker = yf.Ticker(symbol.upper())
-
-        # Get current price
-        info = ticker.info
-        current_price = info.get("currentPrice") or info.get("regularMarketPrice")
+        # Get current price and available expirations concurrently
+        current_price, expirations = await asyncio.gather(
+            get_last_price(symbol.upper()),
+            get_expirations(symbol.upper()),
+        )
         if not current_price:
             raise HTTPException(status_code=404, detail=f"No price data for symbol: {symbol}")
 
-        # Get available expirations
-        expirations = ticker.options
         if not expirations:
             raise HTTPException(
                 status_code=404,
@@ -317,42 +658,30 @@ async def get_options_chain(symbol: str, expiry: str = None):
         selected_expiry = expiry if expiry and expiry in expirations else expirations[0]
 
         # Get options chain
-        chain = ticker.option_chain(selected_expiry)
+        chain = await get_option_chain(symbol.upper(), selected_expiry)
 
         def process_options(df):
             """Convert options dataframe to list of dicts with clean values"""
-            result = []
-            for _, row in df.iterrows():
-                # Get IV and convert to percentage if needed
-                iv = row.get('impliedVolatility', 0)
-                if iv and iv < 1:
-                    iv = iv * 100
-
-                # Handle NaN values
-                def clean_value(val):
-                    if val is None or (isinstance(val, float) and math.isnan(val)):
-                        return None
-                    return val
-
-                result.append({
-                    "contractSymbol": row.get('contractSymbol', ''),
-                    "strike": float(row.get('strike', 0)),
-                    "lastPrice": clean_value(row.get('lastPrice')),
-                    "bid": clean_value(row.get('bid')),
-                    "ask": clean_value(row.get('ask')),
-                    "change": clean_value(row.get('change')),
-                    "percentChange": clean_value(row.get('percentChange')),
-                    "volume": int(row.get('volume', 0)) if row.get('volume') and not math.isnan(row.get('volume')) else None,
-                    "openInterest": int(row.get('openInterest', 0)) if row.get('openInterest') and not math.isnan(row.get('openInterest')) else None,
-                    "impliedVolatility": round(iv, 2) if iv else None,
-                    "inTheMoney": bool(row.get('inTheMoney')) if 'inTheMoney' in row else None,
-                })
-            return result
+            df = df.reindex(columns=OPTION_COLUMNS)
+
+            # Convert IV to percentage if needed; zero IV means no quote
+            iv = df['impliedVolatility']
+            df['impliedVolatility'] = iv.where(iv >= 1, iv * 100).round(2).replace(0, np.nan)
+
+            # Zero volume/open interest is reported as missing
+            for col in ('volume', 'openInterest'):
+                df[col] = df[col].replace(0, np.nan).astype('Int64')
+
+            df['strike'] = df['strike'].astype(float)
+            df['inTheMoney'] = df['inTheMoney'].astype('boolean')
+
+            return to_records(df)
 
         calls = process_options(chain.calls)
         puts = process_options(chain.puts)
 
-        return OptionsChainResponse(
+        # Rows were already cleaned above, so skip re-validating every contract
+        return OptionsChainResponse.model_construct(
             symbol=symbol.upper(),
             expiry=selected_expiry,
             expirations=list(expirations),
@@ -424,75 +753,88 @@ class FundamentalsResponse(BaseModel):
     fiftyTwoWeekChange: Optional[float] = None
 
 
+# FundamentalsResponse field -> yfinance info key, extracted in one itemgetter call
+FUNDAMENTALS_FIELDS = {
+    # Valuation
+    "trailingPE": "trailingPE",
+    "forwardPE": "forwardPE",
+    "priceToBook": "priceToBook",
+    "priceToSales": "priceToSalesTrailingTwelveMonths",
+    "enterpriseToEbitda": "enterpriseToEbitda",
+    "enterpriseToRevenue": "enterpriseToRevenue",
+    "marketCap": "marketCap",
+    "enterpriseValue": "enterpriseValue",
+    # Earnings
+    "trailingEps": "trailingEps",
+    "forwardEps": "forwardEps",
+    "pegRatio": "pegRatio",
+    # Profitability
+    "profitMargins": "profitMargins",
+    "operatingMargins": "operatingMargins",
+    "grossMargins": "grossMargins",
+    "returnOnEquity": "returnOnEquity",
+    "returnOnAssets": "returnOnAssets",
+    # Financial health
+    "debtToEquity": "debtToEquity",
+    "currentRatio": "currentRatio",
+    "quickRatio": "quickRatio",
+    # Analyst targets
+    "targetLow": "targetLowPrice",
+    "targetMean": "targetMeanPrice",
+    "targetMedian": "targetMedianPrice",
+    "targetHigh": "targetHighPrice",
+    "numberOfAnalysts": "numberOfAnalystOpinions",
+    "recommendationKey": "recommendationKey",
+    "recommendationMean": "recommendationMean",
+    # Risk metrics
+    "beta": "beta",
+    "shortRatio": "shortRatio",
+    "shortPercentOfFloat": "shortPercentOfFloat",
+    "heldPercentInsiders": "heldPercentInsiders",
+    "heldPercentInstitutions": "heldPercentInstitutions",
+    # Classification
+    "sector": "sector",
+    "industry": "industry",
+    # Dividends
+    "dividendYield": "dividendYield",
+    "dividendRate": "dividendRate",
+    "payoutRatio": "payoutRatio",
+    "exDividendDate": "exDividendDate",
+    # Growth
+    "revenueGrowth": "revenueGrowth",
+    "earningsGrowth": "earningsGrowth",
+    # 52 week
+    "fiftyTwoWeekHigh": "fiftyTwoWeekHigh",
+    "fiftyTwoWeekLow": "fiftyTwoWeekLow",
+    "fiftyTwoWeekChange": "52WeekChange",
+}
+
+_get_fundamentals = operator.itemgetter(*FUNDAMENTALS_FIELDS.values())
+
+
 @app.get("/fundamentals/{symbol}", response_model=FundamentalsResponse)
+@cached("fundamentals")
 async def get_fundamentals(symbol: str):
     """
     Get fundamental financial metrics for a stock.
     Includes valuation, profitability, analyst targets, and risk metrics.
     """
     try:
-        ticker = yf.Ticker(symbol.upper())
-        info = ticker.info
+        info = await get_info(symbol.upper())
 
         current_price = info.get("currentPrice") or info.get("regularMarketPrice")
         if not current_price:
             raise HTTPException(status_code=404, detail=f"No data found for symbol: {symbol}")
 
+        # Missing keys read as None
+        fields = dict(zip(FUNDAMENTALS_FIELDS, _get_fundamentals(defaultdict(lambda: None, info))))
+        ex_dividend = fields["exDividendDate"]
+        fields["exDividendDate"] = str(ex_dividend) if ex_dividend else None
+
         return FundamentalsResponse(
             symbol=symbol.upper(),
             currentPrice=current_price,
-            # Valuation
-            trailingPE=info.get("trailingPE"),
-            forwardPE=info.get("forwardPE"),
-            priceToBook=info.get("priceToBook"),
-            priceToSales=info.get("priceToSalesTrailingTwelveMonths"),
-            enterpriseToEbitda=info.get("enterpriseToEbitda"),
-            enterpriseToRevenue=info.get("enterpriseToRevenue"),
-            marketCap=info.get("marketCap"),
-            enterpriseValue=info.get("enterpriseValue"),
-            # Earnings
-            trailingEps=info.get("trailingEps"),
-            forwardEps=info.get("forwardEps"),
-            pegRatio=info.get("pegRatio"),
-            # Profitability
-            profitMargins=info.get("profitMargins"),
-            operatingMargins=info.get("operatingMargins"),
-            grossMargins=info.get("grossMargins"),
-            returnOnEquity=info.get("returnOnEquity"),
-            returnOnAssets=info.get("returnOnAssets"),
-            # Financial health
-            debtToEquity=info.get("debtToEquity"),
-            currentRatio=info.get("currentRatio"),
-            quickRatio=info.get("quickRatio"),
-            # Analyst targets
-            targetLow=info.get("targetLowPrice"),
-            targetMean=info.get("targetMeanPrice"),
-            targetMedian=info.get("targetMedianPrice"),
-            targetHigh=info.get("targetHighPrice"),
-            numberOfAnalysts=info.get("numberOfAnalystOpinions"),
-            recommendationKey=info.get("recommendationKey"),
-            recommendationMean=info.get("recommendationMean"),
-            # Risk metrics
-            beta=info.get("beta"),
-            shortRatio=info.get("shortRatio"),
-            shortPercentOfFloat=info.get("shortPercentOfFloat"),
-            heldPercentInsiders=info.get("heldPercentInsiders"),
-            heldPercentInstitutions=info.get("heldPercentInstitutions"),
-            # Classification
-            sector=info.get("sector"),
-            industry=info.get("industry"),
-            # Dividends
-            dividendYield=info.get("dividendYield"),
-            dividendRate=info.get("dividendRate"),
-            payoutRatio=info.get("payoutRatio"),
-            exDividendDate=str(info.get("exDividendDate")) if info.get("exDividendDate") else None,
-            # Growth
-            revenueGrowth=info.get("revenueGrowth"),
-            earningsGrowth=info.get("earningsGrowth"),
-            # 52 week
-            fiftyTwoWeekHigh=info.get("fiftyTwoWeekHigh"),
-            fiftyTwoWeekLow=info.get("fiftyTwoWeekLow"),
-            fiftyTwoWeekChange=info.get("52WeekChange"),
+            **fields,
         )
 
     except HTTPException:
@@ -511,42 +853,42 @@ class EarningsResponse(BaseModel):
 
 
 @app.get("/earnings/{symbol}", response_model=EarningsResponse)
+@cached("earnings", cacheable=lambda r: any(
+    v is not None for v in (r.earningsHistory, r.nextEarningsDate, r.quarterlyEarnings)
+))
 async def get_earnings(symbol: str):
     """
     Get earnings history and upcoming earnings dates for a stock.
     Includes historical earnings surprises and next earnings date.
     """
-    import math
-    from datetime import datetime
-
     try:
-        ticker = yf.Ticker(symbol.upper())
+        ticker = make_ticker(symbol.upper())
 
         # Get earnings dates
         earnings_dates = None
         try:
-            ed = ticker.earnings_dates
+            ed = await run_upstream(lambda: ticker.earnings_dates)
             if ed is not None and not ed.empty:
-                earnings_dates = []
-                for idx, row in ed.head(12).iterrows():  # Last 12 entries
-                    def safe_val(v):
-                        if v is None or (isinstance(v, float) and math.isnan(v)):
-                            return None
-                        return v
-
-                    earnings_dates.append({
-                        "date": idx.isoformat() if hasattr(idx, 'isoformat') else str(idx),
-                        "epsEstimate": safe_val(row.get("EPS Estimate")),
-                        "epsActual": safe_val(row.get("Reported EPS")),
-                        "surprise": safe_val(row.get("Surprise(%)")),
-                    })
+                head = ed.head(12).rename(columns={  # Last 12 entries
+                    "EPS Estimate": "epsEstimate",
+                    "Reported EPS": "epsActual",
+                    "Surprise(%)": "surprise",
+                }).reindex(columns=["epsEstimate", "epsActual", "surprise"])
+                if isinstance(head.index, pd.DatetimeIndex):
+                    dates = format_timestamps(head.index)
+                else:
+                    dates = head.index.astype(str)
+                head.insert(0, "date", dates)
+                earnings_dates = to_records(head)
+        except YFRateLimitError:
+            raise
         except Exception:
             pass
 
         # Get next earnings date from calendar
         next_earnings = None
         try:
-            calendar = ticker.calendar
+            calendar = await run_upstream(lambda: ticker.calendar)
             if calendar is not None:
                 if isinstance(calendar, dict):
                     ed_val = calendar.get("Earnings Date")
@@ -555,21 +897,24 @@ async def get_earnings(symbol: str):
                             next_earnings = str(ed_val[0])
                         else:
                             next_earnings = str(ed_val)
+        except YFRateLimitError:
+            raise
         except Exception:
             pass
 
         # Get quarterly earnings
         quarterly = None
         try:
-            qe = ticker.quarterly_earnings
+            qe = await run_upstream(lambda: ticker.quarterly_earnings)
             if qe is not None and not qe.empty:
-                quarterly = []
-                for idx, row in qe.iterrows():
-                    quarterly.append({
-                        "quarter": str(idx),
-                        "revenue": row.get("Revenue"),
-                        "earnings": row.get("Earnings"),
-                    })
+                qe = qe.rename(columns={
+                    "Revenue": "revenue",
+                    "Earnings": "earnings",
+                }).reindex(columns=["revenue", "earnings"])
+                qe.insert(0, "quarter", qe.index.astype(str))
+                quarterly = to_records(qe)
+        except YFRateLimitError:
+            raise
         except Exception:
             pass
 